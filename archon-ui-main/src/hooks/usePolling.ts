@@ -73,14 +73,18 @@ export function usePolling<T>(
       };
 
       // Include ETag if we have one for this URL (unless forcing refresh)
-      if (etagRef.current && !force) {
-        headers['If-None-Match'] = etagRef.current;
+      const conditional = Boolean(etagRef.current && !force);
+      if (conditional) {
+        headers['If-None-Match'] = etagRef.current as string;
       }
 
       const response = await fetch(url, { 
         method: 'GET',
         headers,
         credentials: 'include',
+        // Unconditional fetches (first load, refetch after a write) must not be
+        // answered from the browser cache, since list endpoints allow a short max-age
+        cache: conditional ? 'default' : 'no-cache',
       });
 
       // Handle 304 Not Modified - data hasn't changed
@@ -242,7 +246,7 @@ export function useTaskPolling(projectId: string, options?: UsePollingOptions<an
  * Hook for polling project list
  */
 export function useProjectPolling(options?: UsePollingOptions<any>) {
-  const url = '/api/projects';
+  const url = '/api/projects?include_content=false';
   
   return usePolling(url, {
     interval: 10000, // 10 seconds for project list
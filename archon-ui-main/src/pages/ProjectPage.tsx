@@ -221,7 +221,14 @@ function ProjectPage({
     setTasks([]); // Clear stale tasks immediately to prevent wrong data showing
     
     try {
-      setSelectedProject(project);
+      // List entries only link to docs/features/data - load them for the project tabs
+      const details = await projectService.getProject(project.id);
+      setSelectedProject({
+        ...project,
+        docs: details.docs,
+        features: details.features,
+        data: details.data,
+      });
       setActiveTab("tasks");
       
       // Update URL to reflect selected project
@@ -63,6 +63,25 @@ export class MCPToolError extends ProjectServiceError {
   }
 }
 
+// Turn a FastAPI error `detail` into a readable message. Request validation
+// failures (422) return a list of { loc, msg } entries rather than a string.
+function formatErrorDetail(detail: unknown): string | undefined {
+  if (typeof detail === 'string') {
+    return detail;
+  }
+  if (Array.isArray(detail)) {
+    const messages = detail.map((item: any) => {
+      const field = Array.isArray(item?.loc) ? item.loc[item.loc.length - 1] : undefined;
+      return field && item?.msg ? `${field}: ${item.msg}` : item?.msg;
+    }).filter(Boolean);
+    return messages.length > 0 ? messages.join('; ') : undefined;
+  }
+  if (detail && typeof detail === 'object' && typeof (detail as any).error === 'string') {
+    return (detail as any).error;
+  }
+  return undefined;
+}
+
 // Helper function to call FastAPI endpoints directly
 async function callAPI<T = any>(endpoint: string, options: RequestInit = {}): Promise<T> {
   try {
@@ -83,7 +102,7 @@ async function callAPI<T = any>(endpoint: string, options: RequestInit = {}): Pr
         const errorBody = await response.text();
         if (errorBody) {
           const errorJson = JSON.parse(errorBody);
-          errorMessage = errorJson.detail || errorJson.error || errorMessage;
+          errorMessage = formatErrorDetail(errorJson.detail) || errorJson.error || errorMessage;
         }
       } catch (e) {
         // Ignore parse errors, use default message
@@ -131,7 +150,7 @@ export const projectService = {
   async listProjects(): Promise<Project[]> {
     try {
       console.log('[PROJECT SERVICE] Fetching projects from API');
-      const projects = await callAPI<Project[]>('/api/projects');
+      const projects = await callAPI<Project[]>('/api/projects?include_content=false');
       console.log('[PROJECT SERVICE] Raw API response:', projects);
       console.log('[PROJECT SERVICE] Raw API response length:', projects.length);
       
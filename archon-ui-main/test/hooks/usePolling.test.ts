@@ -209,6 +209,32 @@ describe('usePolling Hook - REAL Tests', () => {
     }, { timeout: 5000 });
   }, 15000);
 
+  it('should bypass the browser cache on forced refetch', async () => {
+    (global.fetch as any).mockResolvedValue({
+      ok: true,
+      status: 200,
+      json: async () => ({ data: 'test' }),
+      headers: new Headers({ 'etag': '"v1"' })
+    });
+
+    const { result } = renderHook(() => 
+      usePolling('/api/test', { interval: 1000 })
+    );
+
+    await waitFor(() => {
+      expect(result.current.isLoading).toBe(false);
+    }, { timeout: 5000 });
+
+    await act(async () => {
+      await result.current.refetch();
+    });
+
+    // A refetch after a write sends no If-None-Match, so it must revalidate with the server
+    const lastCall = (global.fetch as any).mock.calls.at(-1);
+    expect(lastCall[1].headers['If-None-Match']).toBeUndefined();
+    expect(lastCall[1].cache).toBe('no-cache');
+  }, 15000);
+
   it('should cleanup on unmount', async () => {
     (global.fetch as any).mockResolvedValue({
       ok: true,
@@ -390,4 +390,24 @@ describe('projectService Document Operations', () => {
       consoleSpy.mockRestore();
     });
   });
-});
\ No newline at end of file
+
+  describe('error details', () => {
+    it('should flatten request validation errors into a readable message', async () => {
+      (global.fetch as any).mockResolvedValueOnce({
+        ok: false,
+        status: 422,
+        text: async () => JSON.stringify({
+          detail: [{ type: 'string_too_short', loc: ['body', 'title'], msg: 'String should have at least 1 character' }]
+        })
+      });
+
+      const consoleSpy = vi.spyOn(console, 'error').mockImplementation(() => {});
+
+      await expect(projectService.getProject('proj-456')).rejects.toThrow(
+        'title: String should have at least 1 character'
+      );
+
+      consoleSpy.mockRestore();
+    });
+  });
+});
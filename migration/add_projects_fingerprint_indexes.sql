@@ -0,0 +1,15 @@
+-- =====================================================
+-- Add indexes for projects list fingerprinting
+-- =====================================================
+-- The projects list ETag is built from the row count and newest
+-- timestamp of archon_projects (updated_at) and, for full-content
+-- lists, archon_project_sources (linked_at). These indexes let the
+-- "newest timestamp" lookup read one index entry instead of sorting
+-- the whole table on every fingerprint refresh.
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_archon_projects_updated_at
+    ON archon_projects(updated_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_archon_project_sources_linked_at
+    ON archon_project_sources(linked_at DESC);
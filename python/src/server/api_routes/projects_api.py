@@ -8,13 +8,17 @@ Handles:
 - HTTP polling for progress updates
 """
 
-import json
-from datetime import datetime
-from typing import Any
-
-from fastapi import APIRouter, Header, HTTPException, Request, Response
+import asyncio
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Annotated, Any, Literal
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from fastapi import status as http_status
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, StringConstraints
 
 # Use safe logging functions instead of direct logfire import
 from ..config.logfire_config import (
@@ -24,7 +28,7 @@ from ..config.logfire_config import (
     safe_logfire_warning,
     safe_logfire_debug,
 )
-from ..utils import get_supabase_client
+from ..utils.etag_store import etag_store
 from ..utils.etag_utils import check_etag, generate_etag
 
 logger = get_logger(__name__)
@@ -41,11 +45,116 @@ from ..services.projects.versioning_service import VersioningService
 
 # Using HTTP polling for real-time updates
 
-router = APIRouter(prefix="/api", tags=["projects"])
+# ETag store namespace for the projects list (suffixed with the content variant)
+PROJECTS_LIST_ETAG_KEY = "projects:list"
+
+# Browser caching for the projects list; the lightweight variant changes less
+# visibly, so it may be served from cache longer before revalidating the ETag
+PROJECTS_LIST_CACHE_CONTROL = "private, max-age=5, stale-while-revalidate=30"
+PROJECTS_META_CACHE_CONTROL = "private, max-age=15, stale-while-revalidate=30"
+
+# Large JSONB project fields served from /projects/{id}/content/{field} instead of
+# being embedded in full-content list responses
+PROJECT_CONTENT_FIELDS = ("docs", "features", "data")
+ProjectContentField = Literal["docs", "features", "data"]
+
+# How long a formatted full-content list is reused for the same list ETag
+FORMATTED_PROJECTS_TTL_SECONDS = 30.0
+
+# Last formatted full-content list as (etag, projects, cached_at), replaced atomically
+_formatted_projects_cache: tuple[str, list[dict[str, Any]], float] | None = None
+
+
+def _projects_list_cache_control(include_content: bool) -> str:
+    """Return the Cache-Control value for a projects list variant."""
+    return PROJECTS_LIST_CACHE_CONTROL if include_content else PROJECTS_META_CACHE_CONTROL
+
+
+def _get_cached_formatted_projects(etag: str) -> list[dict[str, Any]] | None:
+    """Return the formatted full-content list built for etag, if still fresh."""
+    cached = _formatted_projects_cache
+    if cached is None:
+        return None
+    cached_etag, projects, cached_at = cached
+    if cached_etag != etag or time.monotonic() - cached_at > FORMATTED_PROJECTS_TTL_SECONDS:
+        return None
+    return projects
+
+
+def _cache_formatted_projects(etag: str, projects: list[dict[str, Any]]) -> None:
+    """Remember the formatted full-content list built for etag."""
+    global _formatted_projects_cache
+    _formatted_projects_cache = (etag, projects, time.monotonic())
+
+
+def _clear_formatted_projects_cache() -> None:
+    """Drop the cached formatted list."""
+    global _formatted_projects_cache
+    _formatted_projects_cache = None
+
+
+async def invalidate_projects_etags(request: Request):
+    """Invalidate cached list ETags once a mutating request on this router finishes."""
+    try:
+        yield
+    finally:
+        if request.method not in ("GET", "HEAD"):
+            etag_store.invalidate(PROJECTS_LIST_ETAG_KEY)
+            _clear_formatted_projects_cache()
+
+
+router = APIRouter(
+    prefix="/api",
+    tags=["projects"],
+    dependencies=[Depends(invalidate_projects_etags)],
+)
+
+# Shared service instances backed by the cached Supabase client, created on first
+# use so importing this module does not require Supabase credentials
+_project_service: ProjectService | None = None
+_creation_service: ProjectCreationService | None = None
+_source_service: SourceLinkingService | None = None
+_task_service: TaskService | None = None
+
+
+def get_project_service() -> ProjectService:
+    """Get or create the shared ProjectService instance"""
+    global _project_service
+    if _project_service is None:
+        _project_service = ProjectService()
+    return _project_service
+
+
+def get_creation_service() -> ProjectCreationService:
+    """Get or create the shared ProjectCreationService instance"""
+    global _creation_service
+    if _creation_service is None:
+        _creation_service = ProjectCreationService()
+    return _creation_service
+
+
+def get_source_service() -> SourceLinkingService:
+    """Get or create the shared SourceLinkingService instance"""
+    global _source_service
+    if _source_service is None:
+        _source_service = SourceLinkingService()
+    return _source_service
+
+
+def get_task_service() -> TaskService:
+    """Get or create the shared TaskService instance"""
+    global _task_service
+    if _task_service is None:
+        _task_service = TaskService()
+    return _task_service
+
+
+# Required text fields: surrounding whitespace is stripped and blank values are rejected with 422
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1, strip_whitespace=True)]
 
 
 class CreateProjectRequest(BaseModel):
-    title: str
+    title: NonEmptyStr
     description: str | None = None
     github_repo: str | None = None
     docs: list[Any] | None = None
@@ -57,7 +166,7 @@ class CreateProjectRequest(BaseModel):
 
 
 class UpdateProjectRequest(BaseModel):
-    title: str | None = None
+    title: NonEmptyStr | None = None
     description: str | None = None  # Add description field
     github_repo: str | None = None
     docs: list[Any] | None = None
@@ -69,8 +178,8 @@ class UpdateProjectRequest(BaseModel):
 
 
 class CreateTaskRequest(BaseModel):
-    project_id: str
-    title: str
+    project_id: NonEmptyStr
+    title: NonEmptyStr
     description: str | None = None
     status: str | None = "todo"
     assignee: str | None = "User"
@@ -78,82 +187,187 @@ class CreateTaskRequest(BaseModel):
     feature: str | None = None
 
 
-@router.get("/projects")
-async def list_projects(
-    response: Response,
-    include_content: bool = True,
-    if_none_match: str | None = Header(None)
-):
-    """
-    List all projects.
-    
-    Args:
-        include_content: If True (default), returns full project content.
-                        If False, returns lightweight metadata with statistics.
-    """
+def _stream_projects_ndjson(include_content: bool) -> Iterator[bytes]:
+    """Yield projects as newline-delimited JSON, one database page at a time."""
     try:
-        safe_logfire_debug(f"Listing all projects | include_content={include_content}")
+        for projects in get_project_service().iter_project_pages(include_content=include_content):
+            if include_content:
+                # One source-link query per page rather than per project; large
+                # fields become links, matching the JSON list
+                projects = [
+                    _defer_project_content(project)
+                    for project in get_source_service().format_projects_with_sources(projects)
+                ]
+            for project in projects:
+                yield orjson.dumps(project) + b"\n"
+    except Exception as e:
+        # Headers are already sent, so the stream can only be aborted
+        safe_logfire_error(f"Failed to stream projects | error={str(e)}")
+        raise
+
 
-        # Use ProjectService to get projects with include_content parameter
-        project_service = ProjectService()
-        success, result = project_service.list_projects(include_content=include_content)
+def _serialize_project_content(content: Any) -> bytes:
+    """Serialize a project content field the same way for list stubs and the content endpoint."""
+    return orjson.dumps(content, default=str)
 
+
+def _defer_project_content(project: dict[str, Any]) -> dict[str, Any]:
+    """Replace inline docs/features/data with links to their streamed content."""
+    deferred = dict(project)
+    for field in PROJECT_CONTENT_FIELDS:
+        payload = _serialize_project_content(project.get(field) or [])
+        deferred[field] = {
+            "href": f"/api/projects/{project['id']}/content/{field}",
+            "etag": generate_etag(payload),
+            "size": len(payload),
+        }
+    return deferred
+
+
+def _stream_project_content(content: Any) -> Iterator[bytes]:
+    """Yield a content field as newline-delimited JSON, one item per line."""
+    items = content if isinstance(content, list) else [content]
+    for item in items:
+        yield orjson.dumps(item, default=str) + b"\n"
+
+
+def projects_list_etag(
+    include_content: bool = False,
+    response_format: Literal["json", "ndjson"] = Query("json", alias="format"),
+    if_none_match: str | None = Header(None),
+) -> str:
+    """
+    Resolve the current ETag for the projects list.
+
+    Runs before the route body so a matching If-None-Match is answered with
+    304 Not Modified without loading or serializing any projects.
+
+    Returns:
+        Current weak ETag for the requested list representation
+    """
+    variant = "full" if include_content else "meta"
+    if response_format == "ndjson":
+        variant += ".ndjson"
+
+    def compute_etag() -> str:
+        # Cheap fingerprint query - no project rows are loaded
+        success, fingerprint_result = get_project_service().get_projects_fingerprint(
+            include_sources=include_content
+        )
         if not success:
-            raise HTTPException(status_code=500, detail=result)
+            safe_logfire_error(f"Failed to fingerprint projects | error={fingerprint_result}")
+            raise HTTPException(status_code=500, detail=fingerprint_result)
+        return f'W/"{variant}:{fingerprint_result["fingerprint"]}"'
+
+    current_etag = etag_store.get_or_compute(f"{PROJECTS_LIST_ETAG_KEY}:{variant}", compute_etag)
+
+    if check_etag(if_none_match, current_etag):
+        raise HTTPException(
+            status_code=http_status.HTTP_304_NOT_MODIFIED,
+            headers={
+                "ETag": current_etag,
+                "Cache-Control": _projects_list_cache_control(include_content),
+            },
+        )
 
-        # Only format with sources if we have full content
-        if include_content:
-            # Use SourceLinkingService to format projects with sources
-            source_service = SourceLinkingService()
-            formatted_projects = source_service.format_projects_with_sources(result["projects"])
-        else:
-            # Lightweight response doesn't need source formatting
-            formatted_projects = result["projects"]
+    return current_etag
 
-        # Monitor response size for optimization validation
-        response_json = json.dumps(formatted_projects)
-        response_size = len(response_json)
 
-        # Log response metrics
+@router.get("/projects", response_class=ORJSONResponse)
+def list_projects(
+    include_content: bool = False,
+    response_format: Literal["json", "ndjson"] = Query("json", alias="format"),
+    current_etag: str = Depends(projects_list_etag),
+):
+    """
+    List all projects.
+    
+    Args:
+        include_content: If False (default), returns lightweight metadata with statistics.
+                        If True, returns full project details with docs/features/data
+                        replaced by {"href", "etag", "size"} links to
+                        /projects/{id}/content/{field}.
+        response_format: "json" (default) returns a single document;
+                        "ndjson" streams one project per line.
+        current_etag: ETag resolved by projects_list_etag (304s never reach here)
+    """
+    try:
         safe_logfire_debug(
-            f"Projects listed successfully | count={len(formatted_projects)} | "
-            f"size_bytes={response_size} | include_content={include_content}"
+            "Listing all projects | include_content={include_content}",
+            include_content=include_content,
         )
 
-        # Log large responses at debug level (>100KB is worth noting, but normal for project data)
-        if response_size > 100000:
-            safe_logfire_debug(
-                f"Large response size | size_bytes={response_size} | "
-                f"include_content={include_content} | project_count={len(formatted_projects)}"
+        if response_format == "ndjson":
+            return StreamingResponse(
+                _stream_projects_ndjson(include_content),
+                media_type="application/x-ndjson",
+                headers={
+                    "ETag": current_etag,
+                    "Cache-Control": _projects_list_cache_control(include_content),
+                },
             )
 
-        # Generate ETag from stable data (excluding timestamp)
-        etag_data = {
-            "projects": formatted_projects,
-            "count": len(formatted_projects)
-        }
-        current_etag = generate_etag(etag_data)
+        # Full-content lists are reused while the list ETag is unchanged
+        formatted_projects = _get_cached_formatted_projects(current_etag) if include_content else None
+
+        if formatted_projects is None:
+            # Use ProjectService to get projects with include_content parameter
+            success, result = get_project_service().list_projects(include_content=include_content)
+
+            if not success:
+                raise HTTPException(status_code=500, detail=result)
+
+            # Only format with sources if we have full content
+            if include_content:
+                # Use SourceLinkingService to format projects with sources
+                formatted_projects = [
+                    _defer_project_content(project)
+                    for project in get_source_service().format_projects_with_sources(result["projects"])
+                ]
+                _cache_formatted_projects(current_etag, formatted_projects)
+            else:
+                # Lightweight response doesn't need source formatting
+                formatted_projects = result["projects"]
 
         # Generate response with timestamp for polling
+        now_iso = datetime.now(UTC).isoformat()
         response_data = {
             "projects": formatted_projects,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso,
             "count": len(formatted_projects)
         }
 
-        # Check if client's ETag matches
-        if check_etag(if_none_match, current_etag):
-            response.status_code = http_status.HTTP_304_NOT_MODIFIED
-            response.headers["ETag"] = current_etag
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            return None
+        # Serialize once with orjson - the rendered body is both sent and measured
+        json_response = ORJSONResponse(
+            content=response_data,
+            headers={
+                "ETag": current_etag,
+                "Last-Modified": now_iso,
+                "Cache-Control": _projects_list_cache_control(include_content),
+            },
+        )
+        response_size = len(json_response.body)
+
+        # Log response metrics
+        safe_logfire_debug(
+            "Projects listed successfully | count={count} | size_bytes={size_bytes} | "
+            "include_content={include_content}",
+            count=len(formatted_projects),
+            size_bytes=response_size,
+            include_content=include_content,
+        )
 
-        # Set headers
-        response.headers["ETag"] = current_etag
-        response.headers["Last-Modified"] = datetime.utcnow().isoformat()
-        response.headers["Cache-Control"] = "no-cache, must-revalidate"
+        # Log large responses at debug level (>100KB is worth noting, but normal for project data)
+        if response_size > 100000:
+            safe_logfire_debug(
+                "Large response size | size_bytes={size_bytes} | include_content={include_content} | "
+                "project_count={project_count}",
+                size_bytes=response_size,
+                include_content=include_content,
+                project_count=len(formatted_projects),
+            )
 
-        return response_data
+        return json_response
 
     except HTTPException:
         raise
@@ -162,16 +376,60 @@ async def list_projects(
         raise HTTPException(status_code=500, detail={"error": str(e)})
 
 
+@router.head("/projects")
+def head_projects(
+    include_content: bool = False,
+    current_etag: str = Depends(projects_list_etag),
+):
+    """
+    Report projects list freshness without a body.
+
+    Accepts the same include_content/format parameters as GET so probes get
+    the matching ETag; a matching If-None-Match returns 304.
+    """
+    return Response(
+        status_code=http_status.HTTP_200_OK,
+        headers={
+            "ETag": current_etag,
+            "Cache-Control": _projects_list_cache_control(include_content),
+        },
+    )
+
+
+@router.get("/projects/{project_id}/content/{field}")
+def stream_project_content(
+    project_id: str,
+    field: ProjectContentField,
+    if_none_match: str | None = Header(None),
+):
+    """
+    Stream one large project field (docs, features or data) as NDJSON.
+
+    Project lists link here instead of embedding the field. The ETag matches
+    the one in the list link, so a matching If-None-Match returns 304.
+    """
+    success, result = get_project_service().get_project_content(project_id, field)
+    if not success:
+        if "not found" in result.get("error", "").lower():
+            raise HTTPException(status_code=404, detail=result)
+        raise HTTPException(status_code=500, detail=result)
+
+    content = result["content"]
+    current_etag = generate_etag(_serialize_project_content(content))
+
+    if check_etag(if_none_match, current_etag):
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers={"ETag": current_etag})
+
+    return StreamingResponse(
+        _stream_project_content(content),
+        media_type="application/x-ndjson",
+        headers={"ETag": current_etag, "Cache-Control": "no-cache, must-revalidate"},
+    )
+
+
 @router.post("/projects")
 async def create_project(request: CreateProjectRequest):
     """Create a new project with streaming progress."""
-    # Validate title
-    if not request.title:
-        raise HTTPException(status_code=422, detail="Title is required")
-
-    if not request.title.strip():
-        raise HTTPException(status_code=422, detail="Title cannot be empty")
-
     try:
         safe_logfire_info(
             f"Creating new project | title={request.title} | github_repo={request.github_repo}"
@@ -187,8 +445,7 @@ async def create_project(request: CreateProjectRequest):
             kwargs["data"] = request.data
 
         # Create project directly with AI assistance
-        project_service = ProjectCreationService()
-        success, result = await project_service.create_project_with_ai(
+        success, result = await get_creation_service().create_project_with_ai(
             progress_id="direct",  # No progress tracking needed
             title=request.title,
             description=request.description,
@@ -212,40 +469,34 @@ async def create_project(request: CreateProjectRequest):
         raise HTTPException(status_code=500, detail={"error": str(e)})
 
 
+def _table_probe_succeeded(table_label: str, probe: tuple[bool, Any] | BaseException) -> bool:
+    """Translate a health-check service probe into table availability, logging the outcome."""
+    if isinstance(probe, BaseException):
+        safe_logfire_warning(f"{table_label} table not found | error={str(probe)}")
+        return False
+
+    success, _ = probe
+    if success:
+        safe_logfire_info(f"{table_label} table detected successfully")
+    else:
+        safe_logfire_warning(f"{table_label} table access failed")
+    return success
+
+
 @router.get("/projects/health")
 async def projects_health():
     """Health check for projects API and database schema validation."""
     try:
         safe_logfire_info("Projects health check requested")
-        supabase_client = get_supabase_client()
-
-        # Check if projects table exists by testing ProjectService
-        try:
-            project_service = ProjectService(supabase_client)
-            # Try to list projects with limit 1 to test table access
-            success, _ = project_service.list_projects()
-            projects_table_exists = success
-            if success:
-                safe_logfire_info("Projects table detected successfully")
-            else:
-                safe_logfire_warning("Projects table access failed")
-        except Exception as e:
-            projects_table_exists = False
-            safe_logfire_warning(f"Projects table not found | error={str(e)}")
-
-        # Check if tasks table exists by testing TaskService
-        try:
-            task_service = TaskService(supabase_client)
-            # Try to list tasks with limit 1 to test table access
-            success, _ = task_service.list_tasks(include_closed=True)
-            tasks_table_exists = success
-            if success:
-                safe_logfire_info("Tasks table detected successfully")
-            else:
-                safe_logfire_warning("Tasks table access failed")
-        except Exception as e:
-            tasks_table_exists = False
-            safe_logfire_warning(f"Tasks table not found | error={str(e)}")
+
+        # Probe the projects and tasks tables concurrently - each is a separate round-trip
+        projects_probe, tasks_probe = await asyncio.gather(
+            asyncio.to_thread(get_project_service().list_projects, include_content=False),
+            asyncio.to_thread(get_task_service().list_tasks, include_closed=True),
+            return_exceptions=True,
+        )
+        projects_table_exists = _table_probe_succeeded("Projects", projects_probe)
+        tasks_table_exists = _table_probe_succeeded("Tasks", tasks_probe)
 
         schema_valid = projects_table_exists and tasks_table_exists
 
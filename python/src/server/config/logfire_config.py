@@ -319,9 +319,13 @@ def safe_logfire_debug(message: str, **kwargs) -> None:
     """
     Safely call logfire.debug if available.
 
+    Pass values as kwargs and reference them as {placeholders} in the message
+    instead of pre-formatting an f-string: logfire fills the template only
+    when it is enabled, so disabled debug logging costs a single check.
+
     Args:
-        message: Log message
-        **kwargs: Additional log data
+        message: Log message template
+        **kwargs: Additional log data (also used to fill the template)
     """
     if _logfire_enabled and logfire:
         try:
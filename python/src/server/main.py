@@ -32,6 +32,7 @@ from .api_routes.settings_api import router as settings_router
 
 # Import Logfire configuration
 from .config.logfire_config import api_logger, setup_logfire
+from .middleware.compression_middleware import StreamingAwareGZipMiddleware
 from .services.background_task_manager import cleanup_task_manager
 from .services.crawler_manager import cleanup_crawler, initialize_crawler
 
@@ -174,6 +175,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (e.g. project lists); ETags are derived from data, not encoded bytes.
+# NDJSON streams are left uncompressed so lines are delivered as they are produced.
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024)
+
 
 # Add middleware to skip logging for health checks
 @app.middleware("http")
@@ -0,0 +1,52 @@
+"""
+Compression Middleware for FastAPI
+
+Gzip-compresses responses with Starlette's GZipMiddleware, but sends streamed
+NDJSON straight to the client. The gzip responder does not flush between
+chunks, so compressing a stream would hold lines back until zlib's buffer
+fills and defeat incremental delivery.
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Response content types that are streamed line by line and must not be buffered
+UNCOMPRESSED_CONTENT_TYPES = ("application/x-ndjson",)
+
+
+class StreamingAwareGZipMiddleware:
+    """
+    GZip middleware that leaves streamed NDJSON responses uncompressed.
+
+    The wrapped app runs inside GZipMiddleware; once a response starts with an
+    uncompressed content type, its messages go directly to the outer send and
+    never reach the gzip responder.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def app_with_bypass(scope: Scope, receive: Receive, gzip_send: Send) -> None:
+            bypass = False
+
+            async def send_or_bypass(message: Message) -> None:
+                nonlocal bypass
+                if message["type"] == "http.response.start":
+                    content_type = Headers(raw=message["headers"]).get("content-type", "")
+                    bypass = content_type.startswith(UNCOMPRESSED_CONTENT_TYPES)
+                await (send if bypass else gzip_send)(message)
+
+            await self.app(scope, receive, send_or_bypass)
+
+        gzip = GZipMiddleware(
+            app_with_bypass, minimum_size=self.minimum_size, compresslevel=self.compresslevel
+        )
+        await gzip(scope, receive, send)
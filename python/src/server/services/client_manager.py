@@ -6,15 +6,45 @@ Manages database and API client connections.
 
 import os
 import re
+from functools import lru_cache
 
+import httpx
+from postgrest.utils import SyncClient
 from supabase import Client, create_client
 
 from ..config.logfire_config import search_logger
 
+# Connection pool limits for the shared PostgREST session
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
 
+
+def _configure_postgrest_session(client: Client) -> None:
+    """
+    Replace the PostgREST httpx session with one using explicit pool limits.
+
+    The session keeps the base URL, headers and timeout Supabase configured, so
+    requests behave the same but reuse keep-alive connections from a bounded pool.
+    """
+    postgrest = client.postgrest
+    session = postgrest.session
+    postgrest.session = SyncClient(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        follow_redirects=True,
+        http2=True,
+        limits=SUPABASE_HTTP_LIMITS,
+    )
+    session.close()
+
+
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """
-    Get a Supabase client instance.
+    Get the shared Supabase client instance.
+
+    The client is created once and cached for the lifetime of the process so
+    every caller reuses the same HTTP connection pool.
 
     Returns:
         Supabase client instance
@@ -28,8 +58,8 @@ def get_supabase_client() -> Client:
         )
 
     try:
-        # Let Supabase handle connection pooling internally
         client = create_client(url, key)
+        _configure_postgrest_session(client)
 
         # Extract project ID from URL for logging purposes only
         match = re.match(r"https://([^.]+)\.supabase\.co", url)
@@ -7,6 +7,7 @@ separating business logic from transport-specific code.
 """
 
 # Removed direct logging import - using unified config
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -85,67 +86,135 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            if include_content:
-                # Current behavior - maintain backward compatibility
+            # Single query - lightweight entries compute their stats from the fetched rows
+            response = (
+                self.supabase_client.table("archon_projects")
+                .select("*")
+                .order("created_at", desc=True)
+                .execute()
+            )
+
+            projects = [
+                self._format_list_entry(project, include_content) for project in response.data
+            ]
+
+            return True, {"projects": projects, "total_count": len(projects)}
+
+        except Exception as e:
+            logger.error(f"Error listing projects: {e}")
+            return False, {"error": f"Error listing projects: {str(e)}"}
+
+    def iter_project_pages(
+        self, include_content: bool = True, page_size: int = 50
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over all projects, fetching them from the database page by page.
+
+        Only one page of rows is held in memory at a time, so callers can stream
+        the list without materializing it, and can batch per-page lookups.
+
+        Args:
+            include_content: Same as list_projects
+            page_size: Number of rows fetched per query
+
+        Yields:
+            Non-empty lists of project dicts shaped like list_projects entries
+
+        Raises:
+            Exception: Database errors propagate so streaming callers can abort
+        """
+        start = 0
+        while True:
+            try:
                 response = (
                     self.supabase_client.table("archon_projects")
                     .select("*")
                     .order("created_at", desc=True)
+                    .order("id")
+                    .range(start, start + page_size - 1)
                     .execute()
                 )
+            except Exception as e:
+                logger.error(f"Error iterating projects at offset {start}: {e}")
+                raise
 
-                projects = []
-                for project in response.data:
-                    projects.append({
-                        "id": project["id"],
-                        "title": project["title"],
-                        "github_repo": project.get("github_repo"),
-                        "created_at": project["created_at"],
-                        "updated_at": project["updated_at"],
-                        "pinned": project.get("pinned", False),
-                        "description": project.get("description", ""),
-                        "docs": project.get("docs", []),
-                        "features": project.get("features", []),
-                        "data": project.get("data", []),
-                    })
-            else:
-                # Lightweight response for MCP - fetch all data but only return metadata + stats
-                # FIXED: N+1 query problem - now using single query
-                response = (
-                    self.supabase_client.table("archon_projects")
-                    .select("*")  # Fetch all fields in single query
-                    .order("created_at", desc=True)
-                    .execute()
-                )
+            if response.data:
+                yield [self._format_list_entry(project, include_content) for project in response.data]
+
+            if len(response.data) < page_size:
+                return
+            start += page_size
+
+    @staticmethod
+    def _format_list_entry(project: dict[str, Any], include_content: bool) -> dict[str, Any]:
+        """Shape a project row for list responses."""
+        entry = {
+            "id": project["id"],
+            "title": project["title"],
+            "github_repo": project.get("github_repo"),
+            "created_at": project["created_at"],
+            "updated_at": project["updated_at"],
+            "pinned": project.get("pinned", False),
+            "description": project.get("description", ""),
+        }
+
+        if include_content:
+            entry["docs"] = project.get("docs", [])
+            entry["features"] = project.get("features", [])
+            entry["data"] = project.get("data", [])
+        else:
+            # Return only metadata + stats, excluding large JSONB fields
+            entry["stats"] = {
+                "docs_count": len(project.get("docs", [])),
+                "features_count": len(project.get("features", [])),
+                "has_data": bool(project.get("data", [])),
+            }
 
-                projects = []
-                for project in response.data:
-                    # Calculate counts from fetched data (no additional queries)
-                    docs_count = len(project.get("docs", []))
-                    features_count = len(project.get("features", []))
-                    has_data = bool(project.get("data", []))
-
-                    # Return only metadata + stats, excluding large JSONB fields
-                    projects.append({
-                        "id": project["id"],
-                        "title": project["title"],
-                        "github_repo": project.get("github_repo"),
-                        "created_at": project["created_at"],
-                        "updated_at": project["updated_at"],
-                        "pinned": project.get("pinned", False),
-                        "description": project.get("description", ""),
-                        "stats": {
-                            "docs_count": docs_count,
-                            "features_count": features_count,
-                            "has_data": has_data
-                        }
-                    })
+        return entry
 
-            return True, {"projects": projects, "total_count": len(projects)}
+    def get_projects_fingerprint(self, include_sources: bool = False) -> tuple[bool, dict[str, Any]]:
+        """
+        Get a cheap fingerprint of the projects list for ETag validation.
+
+        Combines the row count with the newest timestamp, so any insert, update
+        or delete changes the value without fetching project content.
+
+        Args:
+            include_sources: If True, also fingerprints project-source links,
+                           which are part of the full-content list.
+
+        Returns:
+            Tuple of (success, {"fingerprint": str})
+        """
+        try:
+            parts = [self._table_fingerprint("archon_projects", "updated_at")]
+            if include_sources:
+                parts.append(self._table_fingerprint("archon_project_sources", "linked_at"))
+
+            return True, {"fingerprint": "|".join(parts)}
 
         except Exception as e:
-            logger.error(f"Error listing projects: {e}")
-            return False, {"error": f"Error listing projects: {str(e)}"}
+            logger.error(f"Error getting projects fingerprint: {e}")
+            return False, {"error": f"Error getting projects fingerprint: {str(e)}"}
+
+    def _table_fingerprint(self, table: str, timestamp_column: str) -> str:
+        """
+        Return "<count>-<latest timestamp>" for a table using a single query.
+
+        The newest timestamp is read through a descending index on the timestamp
+        column (see migration/add_projects_fingerprint_indexes.sql). The exact
+        count still scans the table, which is fine for the small project tables
+        but is not free.
+        """
+        response = (
+            self.supabase_client.table(table)
+            .select(timestamp_column, count="exact")
+            .order(timestamp_column, desc=True)
+            .limit(1)
+            .execute()
+        )
+        latest = response.data[0][timestamp_column] if response.data else ""
+        return f"{response.count or 0}-{latest}"
 
     def get_project(self, project_id: str) -> tuple[bool, dict[str, Any]]:
         """
@@ -314,6 +383,30 @@ class ProjectService:
             logger.error(f"Error getting project features: {e}")
             return False, {"error": f"Error getting project features: {str(e)}"}
 
+    def get_project_content(self, project_id: str, field: str) -> tuple[bool, dict[str, Any]]:
+        """
+        Get a single JSONB content field (docs, features or data) of a project.
+
+        Returns:
+            Tuple of (success, {"content": ...})
+        """
+        try:
+            response = (
+                self.supabase_client.table("archon_projects")
+                .select(field)
+                .eq("id", project_id)
+                .execute()
+            )
+
+            if not response.data:
+                return False, {"error": f"Project with ID {project_id} not found"}
+
+            return True, {"content": response.data[0].get(field) or []}
+
+        except Exception as e:
+            logger.error(f"Error getting project {field}: {e}")
+            return False, {"error": f"Error getting project {field}: {str(e)}"}
+
     def update_project(
         self, project_id: str, update_fields: dict[str, Any]
     ) -> tuple[bool, dict[str, Any]]:
@@ -58,6 +58,44 @@ class SourceLinkingService:
                 "business_sources": [],
             }
 
+    def get_sources_for_projects(
+        self, project_ids: list[str]
+    ) -> tuple[bool, dict[str, dict[str, list[str]]]]:
+        """
+        Get linked sources for many projects with a single query.
+
+        Returns:
+            Tuple of (success, {project_id: {"technical_sources": [...], "business_sources": [...]}})
+        """
+        sources_by_project = {
+            project_id: {"technical_sources": [], "business_sources": []}
+            for project_id in project_ids
+        }
+        if not project_ids:
+            return True, sources_by_project
+
+        try:
+            response = (
+                self.supabase_client.table("archon_project_sources")
+                .select("project_id, source_id, notes")
+                .in_("project_id", project_ids)
+                .execute()
+            )
+
+            for source_link in response.data:
+                sources = sources_by_project.get(source_link["project_id"])
+                if sources is None:
+                    continue
+                if source_link.get("notes") == "technical":
+                    sources["technical_sources"].append(source_link["source_id"])
+                elif source_link.get("notes") == "business":
+                    sources["business_sources"].append(source_link["source_id"])
+
+            return True, sources_by_project
+        except Exception as e:
+            logger.error(f"Error getting sources for projects: {e}")
+            return False, {"error": f"Failed to retrieve linked sources: {str(e)}"}
+
     def update_project_sources(
         self,
         project_id: str,
@@ -127,19 +165,26 @@ class SourceLinkingService:
             logger.error(f"Error updating project sources: {e}")
             return False, {"error": str(e), **result}
 
-    def format_project_with_sources(self, project: dict[str, Any]) -> dict[str, Any]:
+    def format_project_with_sources(
+        self, project: dict[str, Any], sources: dict[str, list[str]] | None = None
+    ) -> dict[str, Any]:
         """
         Format a project dict with its linked sources included.
         Also handles datetime conversion for JSON compatibility.
 
+        Args:
+            project: Project row to format
+            sources: Pre-fetched linked sources; looked up when not provided
+
         Returns:
             Formatted project dict with technical_sources and business_sources
         """
         # Get linked sources
-        success, sources = self.get_project_sources(project["id"])
-        if not success:
-            logger.warning(f"Failed to get sources for project {project['id']}")
-            sources = {"technical_sources": [], "business_sources": []}
+        if sources is None:
+            success, sources = self.get_project_sources(project["id"])
+            if not success:
+                logger.warning(f"Failed to get sources for project {project['id']}")
+                sources = {"technical_sources": [], "business_sources": []}
 
         # Ensure datetime objects are converted to strings
         created_at = project.get("created_at", "")
@@ -168,10 +213,21 @@ class SourceLinkingService:
         """
         Format a list of projects with their linked sources.
 
+        Sources for all projects are loaded in one query rather than one per project.
+
         Returns:
             List of formatted project dicts
         """
+        success, sources_by_project = self.get_sources_for_projects([p["id"] for p in projects])
+        if not success:
+            logger.warning("Failed to get sources for projects list")
+            sources_by_project = {}
+
         formatted_projects = []
         for project in projects:
-            formatted_projects.append(self.format_project_with_sources(project))
+            sources = sources_by_project.get(project["id"]) or {
+                "technical_sources": [],
+                "business_sources": [],
+            }
+            formatted_projects.append(self.format_project_with_sources(project, sources))
         return formatted_projects
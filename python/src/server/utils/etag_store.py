@@ -0,0 +1,91 @@
+"""
+ETag Store Utility
+
+Keeps current ETags for polled resources in memory so conditional requests
+can be answered without querying the database. Write endpoints invalidate
+the affected keys; entries also expire after a TTL to pick up changes made
+outside this process (e.g. the agents service writing projects directly).
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class EtagStore:
+    """Thread-safe in-memory map of resource key -> current ETag."""
+
+    def __init__(self, ttl_seconds: float = 10.0):
+        """
+        Initialize the store.
+
+        Args:
+            ttl_seconds: How long a stored ETag is trusted before it is recomputed
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """Return the stored ETag for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            etag, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return etag
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        """
+        Return the stored ETag for key, computing and storing it on a miss.
+
+        The computed value is only stored if no invalidation happened while it
+        was being computed, so a write racing with a poll can never leave a
+        stale ETag behind.
+
+        Args:
+            key: Resource key (e.g. "projects:list:full")
+            compute: Callable returning the current ETag; exceptions propagate
+
+        Returns:
+            Current ETag string
+        """
+        etag = self.get(key)
+        if etag is not None:
+            return etag
+
+        with self._lock:
+            generation = self._generation
+
+        etag = compute()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (etag, time.monotonic())
+        return etag
+
+    def invalidate(self, prefix: str) -> None:
+        """
+        Drop every ETag whose key equals prefix or starts with "prefix:".
+
+        Args:
+            prefix: Key or key namespace to invalidate (e.g. "projects:list")
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._entries if k == prefix or k.startswith(f"{prefix}:")]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all stored ETags."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+# Shared store for API routes
+etag_store = EtagStore()
@@ -1,27 +1,33 @@
 """ETag utilities for HTTP caching and efficient polling."""
 
-import hashlib
-import json
 from typing import Any
 
+import orjson
+import xxhash
+
 
 def generate_etag(data: Any) -> str:
     """Generate an ETag hash from data.
     
     Args:
-        data: Any JSON-serializable data to hash
+        data: Any JSON-serializable data to hash, or already-serialized bytes
+              (hashed as-is, avoiding a second serialization pass)
         
     Returns:
-        ETag string (MD5 hash of JSON representation)
+        ETag string (128-bit xxh3 hash of the JSON representation)
     """
-    # Convert data to stable JSON string
-    json_str = json.dumps(data, sort_keys=True, default=str)
-
-    # Generate MD5 hash
-    hash_obj = hashlib.md5(json_str.encode('utf-8'))
+    if isinstance(data, bytes):
+        payload = data
+    else:
+        # Convert data to stable JSON bytes
+        payload = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
 
     # Return ETag in standard format (quoted)
-    return f'"{hash_obj.hexdigest()}"'
+    return f'"{xxhash.xxh3_128_hexdigest(payload)}"'
 
 
 def check_etag(request_etag: str | None, current_etag: str) -> bool:
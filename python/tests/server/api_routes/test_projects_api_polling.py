@@ -1,5 +1,6 @@
 """Unit tests for projects API polling endpoints with ETag support."""
 
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,6 +9,19 @@ from fastapi import HTTPException, Response
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def clear_etag_store():
+    """Start every test with no cached ETags or formatted project lists."""
+    from src.server.api_routes.projects_api import _clear_formatted_projects_cache
+    from src.server.utils.etag_store import etag_store
+
+    etag_store.clear()
+    _clear_formatted_projects_cache()
+    yield
+    etag_store.clear()
+    _clear_formatted_projects_cache()
+
+
 @pytest.fixture
 def test_client():
     """Create a test client for the projects router."""
@@ -19,140 +33,362 @@ def test_client():
     return TestClient(app)
 
 
+def test_services_created_on_first_use():
+    """Test that shared services are built lazily, once, instead of at import time."""
+    from src.server.api_routes import projects_api
+    
+    with patch.object(projects_api, "_project_service", None), \
+         patch.object(projects_api, "ProjectService") as mock_service_class:
+        
+        first = projects_api.get_project_service()
+        second = projects_api.get_project_service()
+        
+        assert first is second is mock_service_class.return_value
+        mock_service_class.assert_called_once_with()
+
+
 class TestProjectsListPolling:
     """Tests for projects list endpoint with polling support."""
 
-    @pytest.mark.asyncio
-    async def test_list_projects_with_etag_generation(self):
+    def test_list_projects_with_etag_generation(self, test_client):
         """Test that list_projects generates ETags correctly."""
-        from src.server.api_routes.projects_api import list_projects
-        
         mock_projects = [
             {"id": "proj-1", "name": "Project 1", "description": "Test project"},
             {"id": "proj-2", "name": "Project 2", "description": "Another project"},
         ]
         
-        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
-             patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
             
-            mock_proj_service = MagicMock()
-            mock_proj_class.return_value = mock_proj_service
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "2-2024-01-01"})
             mock_proj_service.list_projects.return_value = (True, {"projects": mock_projects})
             
-            mock_source_service = MagicMock()
-            mock_source_class.return_value = mock_source_service
             mock_source_service.format_projects_with_sources.return_value = mock_projects
             
-            response = Response()
-            result = await list_projects(response=response, if_none_match=None)
+            response = test_client.get("/api/projects?include_content=true")
+            result = response.json()
             
-            assert result is not None
+            assert response.status_code == 200
             assert len(result["projects"]) == 2
             assert result["count"] == 2
             assert "timestamp" in result
             
-            # Check ETag was set
-            assert "ETag" in response.headers
-            assert response.headers["ETag"].startswith('"')
-            assert response.headers["ETag"].endswith('"')
+            # Check weak ETag was set from the fingerprint
+            assert response.headers["ETag"] == 'W/"full:2-2024-01-01"'
             assert "Last-Modified" in response.headers
-            assert response.headers["Cache-Control"] == "no-cache, must-revalidate"
+            assert response.headers["Cache-Control"] == "private, max-age=5, stale-while-revalidate=30"
 
-    @pytest.mark.asyncio
-    async def test_list_projects_returns_304_with_matching_etag(self):
-        """Test that matching ETag returns 304 Not Modified."""
-        from src.server.api_routes.projects_api import list_projects
-        
+    def test_list_projects_returns_304_with_matching_etag(self, test_client):
+        """Test that matching ETag returns 304 Not Modified without loading projects."""
         mock_projects = [
             {"id": "proj-1", "name": "Project 1", "description": "Test"},
         ]
         
-        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
-             patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
             
-            mock_proj_service = MagicMock()
-            mock_proj_class.return_value = mock_proj_service
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "1-2024-01-01"})
             mock_proj_service.list_projects.return_value = (True, {"projects": mock_projects})
             
-            mock_source_service = MagicMock()
-            mock_source_class.return_value = mock_source_service
             mock_source_service.format_projects_with_sources.return_value = mock_projects
             
             # First request to get ETag
-            response1 = Response()
-            result1 = await list_projects(response=response1, if_none_match=None)
+            response1 = test_client.get("/api/projects?include_content=true")
             etag = response1.headers["ETag"]
+            mock_proj_service.list_projects.reset_mock()
             
             # Second request with same data and ETag
-            response2 = Response()
-            result2 = await list_projects(response=response2, if_none_match=etag)
+            response2 = test_client.get("/api/projects?include_content=true", headers={"If-None-Match": etag})
             
-            assert result2 is None  # No content for 304
+            assert response2.content == b""  # No content for 304
             assert response2.status_code == 304
             assert response2.headers["ETag"] == etag
-            assert response2.headers["Cache-Control"] == "no-cache, must-revalidate"
+            assert response2.headers["Cache-Control"] == "private, max-age=5, stale-while-revalidate=30"
+            mock_proj_service.list_projects.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_list_projects_etag_changes_with_data(self):
+    def test_list_projects_etag_changes_with_data(self, test_client):
         """Test that ETag changes when project data changes."""
-        from src.server.api_routes.projects_api import list_projects
+        from src.server.utils.etag_store import etag_store
         
-        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
-             patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
             
-            mock_proj_service = MagicMock()
-            mock_proj_class.return_value = mock_proj_service
-            mock_source_service = MagicMock()
-            mock_source_class.return_value = mock_source_service
             
             # Initial data
             projects1 = [{"id": "proj-1", "name": "Project 1"}]
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "1-2024-01-01"})
             mock_proj_service.list_projects.return_value = (True, {"projects": projects1})
             mock_source_service.format_projects_with_sources.return_value = projects1
             
-            response1 = Response()
-            await list_projects(response=response1, if_none_match=None)
+            response1 = test_client.get("/api/projects")
             etag1 = response1.headers["ETag"]
             
-            # Modified data
+            # Modified data - writes through the API invalidate the stored ETag
+            etag_store.invalidate("projects:list")
             projects2 = [{"id": "proj-1", "name": "Project 1 Updated"}]
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "1-2024-01-02"})
             mock_proj_service.list_projects.return_value = (True, {"projects": projects2})
             mock_source_service.format_projects_with_sources.return_value = projects2
             
-            response2 = Response()
-            await list_projects(response=response2, if_none_match=etag1)
+            response2 = test_client.get("/api/projects", headers={"If-None-Match": etag1})
             etag2 = response2.headers["ETag"]
             
             assert etag1 != etag2
-            assert response2.status_code != 304
+            assert response2.status_code == 200
+            assert response2.json()["projects"][0]["name"] == "Project 1 Updated"
 
-    def test_list_projects_http_with_etag(self, test_client):
-        """Test projects endpoint via HTTP with ETag support."""
-        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
-             patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
+    def test_list_projects_etag_differs_by_content_mode(self, test_client):
+        """Test that full and lightweight responses never share an ETag."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
             
-            mock_proj_service = MagicMock()
-            mock_proj_class.return_value = mock_proj_service
-            projects = [{"id": "proj-1", "name": "Test Project"}]
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "0-"})
+            mock_proj_service.list_projects.return_value = (True, {"projects": []})
+            mock_source_service.format_projects_with_sources.return_value = []
+            
+            full_etag = test_client.get("/api/projects?include_content=true").headers["ETag"]
+            response = test_client.get(
+                "/api/projects?include_content=false", headers={"If-None-Match": full_etag}
+            )
+            
+            assert response.status_code == 200
+            assert response.headers["ETag"] != full_etag
+
+    def test_list_projects_defaults_to_metadata(self, test_client):
+        """Test that listing without include_content returns the lightweight variant."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
+            
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "1-2024-01-01"})
+            mock_proj_service.list_projects.return_value = (True, {"projects": [{"id": "proj-1"}]})
+            
+            response = test_client.get("/api/projects")
+            
+            assert response.status_code == 200
+            assert response.headers["ETag"] == 'W/"meta:1-2024-01-01"'
+            mock_proj_service.list_projects.assert_called_once_with(include_content=False)
+            mock_source_service.format_projects_with_sources.assert_not_called()
+
+    def test_projects_list_etag_dependency_short_circuits(self):
+        """Test that the ETag dependency raises 304 before the route body runs."""
+        from src.server.api_routes.projects_api import projects_list_etag
+        
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service:
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "3-x"})
+            
+            etag = projects_list_etag(include_content=False, response_format="json", if_none_match=None)
+            assert etag == 'W/"meta:3-x"'
+            
+            with pytest.raises(HTTPException) as exc_info:
+                projects_list_etag(include_content=False, response_format="json", if_none_match=etag)
+            
+            assert exc_info.value.status_code == 304
+            assert exc_info.value.headers["ETag"] == etag
+            mock_proj_service.list_projects.assert_not_called()
+
+    def test_projects_list_etag_fingerprint_failure(self, test_client):
+        """Test that a failing fingerprint query surfaces as a 500."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service:
+            mock_proj_service.get_projects_fingerprint.return_value = (False, {"error": "db down"})
+            
+            response = test_client.get("/api/projects")
+            
+            assert response.status_code == 500
+            mock_proj_service.list_projects.assert_not_called()
+
+    def test_list_projects_serializes_body_once(self, test_client):
+        """Test that a 200 serializes the payload exactly once and a 304 not at all."""
+        import orjson
+        
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("fastapi.responses.orjson.dumps", wraps=orjson.dumps) as mock_dumps:
+            
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "1-2024-01-01"})
+            mock_proj_service.list_projects.return_value = (True, {"projects": [{"id": "proj-1"}]})
+            
+            response = test_client.get("/api/projects?include_content=false")
+            assert mock_dumps.call_count == 1
+            
+            test_client.get(
+                "/api/projects?include_content=false", headers={"If-None-Match": response.headers["ETag"]}
+            )
+            assert mock_dumps.call_count == 1
+
+    def test_list_projects_ndjson_stream(self, test_client):
+        """Test that format=ndjson streams one project per line with its own ETag."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service:
+            projects = [
+                {"id": "proj-1", "title": "Project 1", "stats": {"docs_count": 0}},
+                {"id": "proj-2", "title": "Project 2", "stats": {"docs_count": 2}},
+            ]
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "2-2024-01-01"})
+            mock_proj_service.iter_project_pages.return_value = iter([projects])
+            
+            response = test_client.get("/api/projects?include_content=false&format=ndjson")
+            
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            assert response.headers["ETag"] == 'W/"meta.ndjson:2-2024-01-01"'
+            lines = response.content.splitlines()
+            assert [json.loads(line) for line in lines] == projects
+            mock_proj_service.list_projects.assert_not_called()
+
+    def test_list_projects_ndjson_formats_sources_per_page(self, test_client):
+        """Test that the full-content stream loads source links once per page, not per project."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
+            
+            pages = [[{"id": "proj-1"}, {"id": "proj-2"}], [{"id": "proj-3"}]]
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "3-2024-01-01"})
+            mock_proj_service.iter_project_pages.return_value = iter(pages)
+            mock_source_service.format_projects_with_sources.side_effect = lambda page: page
+            
+            response = test_client.get("/api/projects?include_content=true&format=ndjson")
+            
+            streamed = [json.loads(line) for line in response.content.splitlines()]
+            assert [project["id"] for project in streamed] == ["proj-1", "proj-2", "proj-3"]
+            assert streamed[0]["docs"]["href"] == "/api/projects/proj-1/content/docs"
+            assert mock_source_service.format_projects_with_sources.call_count == 2
+            mock_source_service.format_project_with_sources.assert_not_called()
+
+    def test_head_projects_returns_etag_only(self, test_client):
+        """Test that HEAD /projects reports the list ETag without loading projects."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service:
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "4-2024-01-01"})
+            
+            response = test_client.head("/api/projects?include_content=false")
+            
+            assert response.status_code == 200
+            assert response.content == b""
+            assert response.headers["ETag"] == 'W/"meta:4-2024-01-01"'
+            assert response.headers["Cache-Control"] == "private, max-age=15, stale-while-revalidate=30"
+            
+            response = test_client.head(
+                "/api/projects?include_content=false", headers={"If-None-Match": response.headers["ETag"]}
+            )
+            
+            assert response.status_code == 304
+            mock_proj_service.list_projects.assert_not_called()
+
+    def test_list_projects_etag_served_from_store(self, test_client):
+        """Test that polls reuse the stored ETag instead of re-running the fingerprint query."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service:
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "0-"})
+            mock_proj_service.list_projects.return_value = (True, {"projects": []})
+            
+            etag = test_client.get("/api/projects?include_content=false").headers["ETag"]
+            response = test_client.get("/api/projects?include_content=false", headers={"If-None-Match": etag})
+            
+            assert response.status_code == 304
+            mock_proj_service.get_projects_fingerprint.assert_called_once()
+
+    def test_list_projects_reuses_formatted_projects(self, test_client):
+        """Test that full-content polls without If-None-Match reuse the formatted list."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service, \
+             patch("src.server.api_routes.projects_api._creation_service") as mock_creation_service:
+            
+            projects = [{"id": "proj-1", "title": "Project 1", "technical_sources": ["src-1"]}]
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "1-2024-01-01"})
             mock_proj_service.list_projects.return_value = (True, {"projects": projects})
+            mock_source_service.format_projects_with_sources.return_value = projects
+            mock_creation_service.create_project_with_ai = AsyncMock(
+                return_value=(True, {"project_id": "proj-2", "project": {"id": "proj-2"}})
+            )
+            
+            first = test_client.get("/api/projects?include_content=true")
+            second = test_client.get("/api/projects?include_content=true")
+            
+            assert first.json()["projects"] == second.json()["projects"]
+            assert first.json()["projects"][0]["technical_sources"] == ["src-1"]
+            mock_proj_service.list_projects.assert_called_once()
+            mock_source_service.format_projects_with_sources.assert_called_once()
+            
+            # A write drops the cached list
+            test_client.post("/api/projects", json={"title": "Another Project"})
+            test_client.get("/api/projects?include_content=true")
             
-            mock_source_service = MagicMock()
-            mock_source_class.return_value = mock_source_service
+            assert mock_source_service.format_projects_with_sources.call_count == 2
+
+    def test_list_projects_defers_large_content(self, test_client):
+        """Test that full-content lists link to docs/features/data instead of embedding them."""
+        from src.server.utils.etag_utils import generate_etag
+        
+        docs = [{"id": "doc-1", "title": "PRD", "content": {"body": "x" * 500}}]
+        projects = [{"id": "proj-1", "title": "Project 1", "docs": docs, "features": [], "data": []}]
+        
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
+            
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "1-2024-01-01"})
+            mock_proj_service.list_projects.return_value = (True, {"projects": projects})
             mock_source_service.format_projects_with_sources.return_value = projects
+            mock_proj_service.get_project_content.return_value = (True, {"content": docs})
             
-            # First request
-            response1 = test_client.get("/api/projects")
-            assert response1.status_code == 200
-            assert "ETag" in response1.headers
-            etag = response1.headers["ETag"]
+            project = test_client.get("/api/projects?include_content=true").json()["projects"][0]
             
-            # Second request with If-None-Match
-            response2 = test_client.get(
-                "/api/projects",
-                headers={"If-None-Match": etag}
+            assert project["docs"]["href"] == "/api/projects/proj-1/content/docs"
+            assert project["docs"]["size"] > 500
+            assert project["features"]["size"] == 2
+            
+            response = test_client.get(project["docs"]["href"])
+            
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            assert response.headers["ETag"] == project["docs"]["etag"] == generate_etag(json.dumps(docs, separators=(",", ":")).encode())
+            assert [json.loads(line) for line in response.text.splitlines()] == docs
+            mock_proj_service.get_project_content.assert_called_once_with("proj-1", "docs")
+            
+            response = test_client.get(project["docs"]["href"], headers={"If-None-Match": project["docs"]["etag"]})
+            
+            assert response.status_code == 304
+
+    def test_project_content_not_found(self, test_client):
+        """Test that streaming content for an unknown project returns 404."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service:
+            mock_proj_service.get_project_content.return_value = (
+                False, {"error": "Project with ID missing not found"}
             )
-            assert response2.status_code == 304
-            assert response2.content == b""
+            
+            assert test_client.get("/api/projects/missing/content/features").status_code == 404
+            assert test_client.get("/api/projects/missing/content/secrets").status_code == 422
+
+    def test_create_project_invalidates_list_etag(self, test_client):
+        """Test that a write on the projects router invalidates the stored list ETag."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._creation_service") as mock_creation_service:
+            
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "0-"})
+            mock_proj_service.list_projects.return_value = (True, {"projects": []})
+            mock_creation_service.create_project_with_ai = AsyncMock(
+                return_value=(True, {"project_id": "proj-1", "project": {"id": "proj-1"}})
+            )
+            
+            test_client.get("/api/projects?include_content=false")
+            assert mock_proj_service.get_projects_fingerprint.call_count == 1
+            
+            response = test_client.post("/api/projects", json={"title": "New Project"})
+            assert response.status_code == 200
+            
+            test_client.get("/api/projects?include_content=false")
+            assert mock_proj_service.get_projects_fingerprint.call_count == 2
+
+    def test_create_project_rejects_blank_title(self, test_client):
+        """Test that blank titles fail request validation and valid titles are stripped."""
+        with patch("src.server.api_routes.projects_api._creation_service") as mock_creation_service:
+            mock_creation_service.create_project_with_ai = AsyncMock(
+                return_value=(True, {"project_id": "proj-1", "project": {"id": "proj-1"}})
+            )
+            
+            for title in ["", "   "]:
+                response = test_client.post("/api/projects", json={"title": title})
+                assert response.status_code == 422
+            mock_creation_service.create_project_with_ai.assert_not_called()
+            
+            response = test_client.post("/api/projects", json={"title": "  New Project  "})
+            
+            assert response.status_code == 200
+            assert mock_creation_service.create_project_with_ai.call_args.kwargs["title"] == "New Project"
 
 
 class TestProjectTasksPolling:
@@ -269,32 +505,25 @@ class TestProjectTasksPolling:
 class TestPollingEdgeCases:
     """Test edge cases in polling implementation."""
 
-    @pytest.mark.asyncio
-    async def test_empty_projects_list_etag(self):
+    def test_empty_projects_list_etag(self, test_client):
         """Test ETag generation for empty projects list."""
-        from src.server.api_routes.projects_api import list_projects
-        
-        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
-             patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._source_service") as mock_source_service:
             
-            mock_proj_service = MagicMock()
-            mock_proj_class.return_value = mock_proj_service
+            mock_proj_service.get_projects_fingerprint.return_value = (True, {"fingerprint": "0-"})
             mock_proj_service.list_projects.return_value = (True, {"projects": []})
             
-            mock_source_service = MagicMock()
-            mock_source_class.return_value = mock_source_service
             mock_source_service.format_projects_with_sources.return_value = []
             
-            response = Response()
-            result = await list_projects(response=response)
+            response = test_client.get("/api/projects")
+            result = response.json()
             
             assert result["projects"] == []
             assert result["count"] == 0
             assert "ETag" in response.headers
             
             # Empty list should still have a stable ETag
-            response2 = Response()
-            await list_projects(response=response2, if_none_match=response.headers["ETag"])
+            response2 = test_client.get("/api/projects", headers={"If-None-Match": response.headers["ETag"]})
             assert response2.status_code == 304
 
     @pytest.mark.asyncio
@@ -326,4 +555,35 @@ class TestPollingEdgeCases:
             # The actual endpoint returns 500 when TaskService fails (not 404)
             assert exc_info.value.status_code == 500
             # Response headers shouldn't be set on exception
-            assert "ETag" not in response.headers
\ No newline at end of file
+            assert "ETag" not in response.headers
+
+class TestProjectsHealth:
+    """Tests for the projects health check."""
+
+    def test_projects_health_healthy(self, test_client):
+        """Test that both table probes succeeding reports a valid schema."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._task_service") as mock_task_service:
+            
+            mock_proj_service.list_projects.return_value = (True, {"projects": []})
+            mock_task_service.list_tasks.return_value = (True, {"tasks": []})
+            
+            response = test_client.get("/api/projects/health")
+            
+            assert response.status_code == 200
+            assert response.json()["status"] == "healthy"
+            assert response.json()["schema"] == {"projects_table": True, "tasks_table": True, "valid": True}
+            mock_task_service.list_tasks.assert_called_once_with(include_closed=True)
+
+    def test_projects_health_probe_exception(self, test_client):
+        """Test that a raising probe marks only its table as missing."""
+        with patch("src.server.api_routes.projects_api._project_service") as mock_proj_service, \
+             patch("src.server.api_routes.projects_api._task_service") as mock_task_service:
+            
+            mock_proj_service.list_projects.return_value = (True, {"projects": []})
+            mock_task_service.list_tasks.side_effect = Exception("relation archon_tasks does not exist")
+            
+            response = test_client.get("/api/projects/health")
+            
+            assert response.json()["status"] == "schema_missing"
+            assert response.json()["schema"] == {"projects_table": True, "tasks_table": False, "valid": False}
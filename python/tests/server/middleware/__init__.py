@@ -0,0 +1 @@
+"""Test module for server middleware."""
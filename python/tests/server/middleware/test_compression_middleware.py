@@ -0,0 +1,51 @@
+"""Unit tests for the streaming-aware gzip middleware."""
+
+from src.server.middleware.compression_middleware import StreamingAwareGZipMiddleware
+
+LINE = b'{"id": "' + b"x" * 2048 + b'"}\n'
+
+
+def _make_app(content_type: bytes):
+    """Build an ASGI app that streams two large lines with the given content type."""
+
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", content_type)],
+        })
+        await send({"type": "http.response.body", "body": LINE, "more_body": True})
+        await send({"type": "http.response.body", "body": LINE, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    return StreamingAwareGZipMiddleware(app, minimum_size=1024)
+
+
+async def _collect_messages(app) -> list[dict]:
+    """Run one gzip-accepting GET through the app and return the messages it sends."""
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+async def test_ndjson_stream_passes_through_uncompressed():
+    messages = await _collect_messages(_make_app(b"application/x-ndjson"))
+
+    assert b"content-encoding" not in dict(messages[0]["headers"])
+
+    # Each line is forwarded as soon as it is produced, not held in a gzip buffer
+    assert [m["body"] for m in messages[1:]] == [LINE, LINE, b""]
+
+
+async def test_other_streams_are_compressed():
+    messages = await _collect_messages(_make_app(b"application/json"))
+
+    assert dict(messages[0]["headers"])[b"content-encoding"] == b"gzip"
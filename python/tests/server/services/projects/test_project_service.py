@@ -0,0 +1,96 @@
+"""Unit tests for ProjectService list freshness helpers."""
+
+from unittest.mock import MagicMock
+
+from src.server.services.projects import ProjectService
+
+
+def _mock_client(responses: dict[str, MagicMock]) -> MagicMock:
+    """Build a Supabase client mock returning a canned response per table."""
+    client = MagicMock()
+
+    def table(name):
+        query = MagicMock()
+        query.select.return_value = query
+        query.order.return_value = query
+        query.limit.return_value = query
+        query.execute.return_value = responses[name]
+        return query
+
+    client.table.side_effect = table
+    return client
+
+
+def _response(data, count):
+    response = MagicMock()
+    response.data = data
+    response.count = count
+    return response
+
+
+class TestProjectsFingerprint:
+    """Tests for ProjectService.get_projects_fingerprint."""
+
+    def test_fingerprint_uses_count_and_latest_update(self):
+        client = _mock_client({
+            "archon_projects": _response([{"updated_at": "2024-01-02T00:00:00+00:00"}], 3),
+        })
+
+        success, result = ProjectService(client).get_projects_fingerprint()
+
+        assert success
+        assert result["fingerprint"] == "3-2024-01-02T00:00:00+00:00"
+
+    def test_fingerprint_empty_table(self):
+        client = _mock_client({"archon_projects": _response([], 0)})
+
+        success, result = ProjectService(client).get_projects_fingerprint()
+
+        assert success
+        assert result["fingerprint"] == "0-"
+
+    def test_fingerprint_includes_source_links(self):
+        client = _mock_client({
+            "archon_projects": _response([{"updated_at": "2024-01-02"}], 1),
+            "archon_project_sources": _response([{"linked_at": "2024-01-03"}], 2),
+        })
+
+        success, result = ProjectService(client).get_projects_fingerprint(include_sources=True)
+
+        assert success
+        assert result["fingerprint"] == "1-2024-01-02|2-2024-01-03"
+
+    def test_fingerprint_database_error(self):
+        client = MagicMock()
+        client.table.side_effect = Exception("connection refused")
+
+        success, result = ProjectService(client).get_projects_fingerprint()
+
+        assert not success
+        assert "connection refused" in result["error"]
+
+
+class TestIterProjects:
+    """Tests for ProjectService.iter_project_pages paging."""
+
+    def test_iter_project_pages_fetches_pages_until_short_page(self):
+        rows = [
+            {"id": f"proj-{i}", "title": f"P{i}", "created_at": "c", "updated_at": "u", "docs": [{}]}
+            for i in range(5)
+        ]
+        client = MagicMock()
+        query = client.table.return_value
+        query.select.return_value = query
+        query.order.return_value = query
+        query.range.side_effect = lambda start, end: MagicMock(
+            execute=MagicMock(return_value=_response(rows[start:end + 1], None))
+        )
+
+        pages = list(ProjectService(client).iter_project_pages(include_content=False, page_size=2))
+        projects = [project for page in pages for project in page]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [p["id"] for p in projects] == [f"proj-{i}" for i in range(5)]
+        assert projects[0]["stats"]["docs_count"] == 1
+        assert "docs" not in projects[0]
+        assert [call.args for call in query.range.call_args_list] == [(0, 1), (2, 3), (4, 5)]
@@ -0,0 +1,74 @@
+"""Unit tests for SourceLinkingService list formatting."""
+
+from unittest.mock import MagicMock, patch
+
+from src.server.services.projects import SourceLinkingService
+
+
+def _mock_client(links):
+    """Build a Supabase client mock whose archon_project_sources query returns links."""
+    client = MagicMock()
+    query = client.table.return_value
+    query.select.return_value = query
+    query.in_.return_value = query
+    query.execute.return_value = MagicMock(data=links)
+    return client
+
+
+class TestFormatProjectsWithSources:
+    """Tests for SourceLinkingService.format_projects_with_sources."""
+
+    def test_sources_loaded_in_single_query(self):
+        client = _mock_client([
+            {"project_id": "proj-1", "source_id": "src-a", "notes": "technical"},
+            {"project_id": "proj-1", "source_id": "src-b", "notes": "business"},
+            {"project_id": "proj-2", "source_id": "src-c", "notes": "technical"},
+        ])
+        projects = [
+            {"id": "proj-1", "title": "One", "created_at": "c", "updated_at": "u"},
+            {"id": "proj-2", "title": "Two", "created_at": "c", "updated_at": "u"},
+            {"id": "proj-3", "title": "Three", "created_at": "c", "updated_at": "u"},
+        ]
+
+        formatted = SourceLinkingService(client).format_projects_with_sources(projects)
+
+        assert client.table.call_count == 1
+        client.table.return_value.in_.assert_called_once_with(
+            "project_id", ["proj-1", "proj-2", "proj-3"]
+        )
+        assert formatted[0]["technical_sources"] == ["src-a"]
+        assert formatted[0]["business_sources"] == ["src-b"]
+        assert formatted[1]["technical_sources"] == ["src-c"]
+        assert formatted[2]["technical_sources"] == []
+        assert formatted[2]["business_sources"] == []
+
+    def test_projects_without_links_get_separate_lists(self):
+        client = _mock_client([])
+        projects = [{"id": "proj-1", "title": "One"}, {"id": "proj-2", "title": "Two"}]
+
+        with patch.object(
+            SourceLinkingService, "get_sources_for_projects", return_value=(True, {})
+        ):
+            formatted = SourceLinkingService(client).format_projects_with_sources(projects)
+
+        formatted[0]["technical_sources"].append("src-a")
+
+        assert formatted[1]["technical_sources"] == []
+
+    def test_empty_list_skips_query(self):
+        client = MagicMock()
+
+        assert SourceLinkingService(client).format_projects_with_sources([]) == []
+        client.table.assert_not_called()
+
+    def test_source_lookup_failure_formats_without_sources(self):
+        client = MagicMock()
+        client.table.side_effect = Exception("connection refused")
+
+        formatted = SourceLinkingService(client).format_projects_with_sources(
+            [{"id": "proj-1", "title": "One"}]
+        )
+
+        assert formatted[0]["id"] == "proj-1"
+        assert formatted[0]["technical_sources"] == []
+        assert formatted[0]["business_sources"] == []
@@ -0,0 +1,64 @@
+"""Unit tests for the in-memory ETag store."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.server.utils.etag_store import EtagStore
+
+
+class TestEtagStore:
+    """Tests for EtagStore get/compute/invalidate behaviour."""
+
+    def test_get_missing_key(self):
+        store = EtagStore()
+        assert store.get("projects:list:full") is None
+
+    def test_get_or_compute_caches_value(self):
+        store = EtagStore()
+        compute = MagicMock(return_value='W/"1-a"')
+
+        assert store.get_or_compute("projects:list:full", compute) == 'W/"1-a"'
+        assert store.get_or_compute("projects:list:full", compute) == 'W/"1-a"'
+        compute.assert_called_once()
+
+    def test_get_or_compute_propagates_errors(self):
+        store = EtagStore()
+
+        with pytest.raises(RuntimeError):
+            store.get_or_compute("projects:list:full", MagicMock(side_effect=RuntimeError("db down")))
+
+        assert store.get("projects:list:full") is None
+
+    def test_invalidate_prefix(self):
+        store = EtagStore()
+        store.get_or_compute("projects:list:full", lambda: '"a"')
+        store.get_or_compute("projects:list:meta", lambda: '"b"')
+        store.get_or_compute("projects:listing", lambda: '"c"')
+
+        store.invalidate("projects:list")
+
+        assert store.get("projects:list:full") is None
+        assert store.get("projects:list:meta") is None
+        assert store.get("projects:listing") == '"c"'
+
+    def test_entries_expire_after_ttl(self):
+        store = EtagStore(ttl_seconds=5)
+
+        with patch("src.server.utils.etag_store.time.monotonic", return_value=100.0):
+            store.get_or_compute("projects:list:full", lambda: '"a"')
+        with patch("src.server.utils.etag_store.time.monotonic", return_value=104.0):
+            assert store.get("projects:list:full") == '"a"'
+        with patch("src.server.utils.etag_store.time.monotonic", return_value=106.0):
+            assert store.get("projects:list:full") is None
+
+    def test_invalidation_during_compute_is_not_overwritten(self):
+        store = EtagStore()
+
+        def compute():
+            # A write lands while the fingerprint query is in flight
+            store.invalidate("projects:list")
+            return '"stale"'
+
+        assert store.get_or_compute("projects:list:full", compute) == '"stale"'
+        assert store.get("projects:list:full") is None
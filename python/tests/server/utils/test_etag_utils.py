@@ -15,10 +15,10 @@ class TestGenerateEtag:
         data = {"name": "test", "value": 123, "active": True}
         etag = generate_etag(data)
         
-        # ETag should be quoted MD5 hash
+        # ETag should be quoted 128-bit hash
         assert etag.startswith('"')
         assert etag.endswith('"')
-        assert len(etag) == 34  # 32 char MD5 + 2 quotes
+        assert len(etag) == 34  # 32 hex chars + 2 quotes
         
         # Same data should generate same ETag
         etag2 = generate_etag(data)
@@ -85,6 +85,20 @@ class TestGenerateEtag:
         assert etag_list.startswith('"')
         assert etag_dict != etag_list
 
+    def test_generate_etag_with_serialized_bytes(self):
+        """Test that pre-serialized bytes are hashed without re-encoding."""
+        body = b'{"count":1,"projects":[{"id":"proj-1"}]}'
+        
+        assert generate_etag(body) == generate_etag(body)
+        assert generate_etag(body) != generate_etag(body + b" ")
+
+    def test_generate_etag_with_non_string_keys(self):
+        """Test ETag generation with non-string dictionary keys."""
+        etag = generate_etag({1: "one", 2: "two"})
+        
+        assert etag.startswith('"')
+        assert etag == generate_etag({2: "two", 1: "one"})
+
 
 class TestCheckEtag:
     """Tests for ETag checking function."""
@@ -112,3 +112,14 @@ def test_error_handling(client):
     # Test invalid JSON
     response = client.post("/api/projects", data="invalid json")
     assert response.status_code in [400, 422]
+
+
+def test_large_responses_are_compressed(client):
+    """Test that responses over 1KB are gzip-compressed when the client accepts it."""
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+    # Small responses are sent uncompressed
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers